@@ -5,8 +5,16 @@ import os
 import sys
 import subprocess
 import shutil
+import tempfile
 from pathlib import Path
 
+# Persistent pip cache and local wheelhouse so repeated builds skip downloads
+PIP_CACHE_DIR = Path.home() / ".cache" / "work-order-checker-pip"
+WHEELHOUSE_DIR = Path("wheelhouse")
+
+# PyInstaller spec defining both the GUI and console executables
+SPEC_FILE = "work_order_checker.spec"
+
 def install_requirements():
     """Install required packages for building."""
     print("Installing build requirements...")
@@ -22,50 +30,85 @@ def install_requirements():
         "tkinterdnd2"
     ]
     
-    for req in requirements:
-        print(f"Installing {req}...")
-        subprocess.run([sys.executable, "-m", "pip", "install", req], check=True)
+    # Write the list to a temporary requirements file so pip resolves
+    # everything in a single invocation instead of once per package
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as fh:
+        fh.write("\n".join(requirements) + "\n")
+        requirements_file = fh.name
+    
+    try:
+        # Populate the local wheelhouse, reusing wheels from previous builds
+        print(f"Building wheels into {WHEELHOUSE_DIR}...")
+        subprocess.run([
+            sys.executable, "-m", "pip", "wheel",
+            "--cache-dir", str(PIP_CACHE_DIR),
+            "--prefer-binary",
+            "--find-links", str(WHEELHOUSE_DIR),
+            "-w", str(WHEELHOUSE_DIR),
+            "-r", requirements_file
+        ], check=True)
+        
+        # Install everything from the wheelhouse without touching the network
+        print("Installing from wheelhouse...")
+        subprocess.run([
+            sys.executable, "-m", "pip", "install",
+            "--no-index",
+            "--find-links", str(WHEELHOUSE_DIR),
+            "-r", requirements_file
+        ], check=True)
+    finally:
+        os.unlink(requirements_file)
 
 def build_executable():
-    """Build the Windows executable."""
-    print("Building Windows executable...")
+    """Build the Windows executables."""
+    print("Building Windows executables...")
     
-    # PyInstaller command for GUI version
-    gui_cmd = [
+    # Both the GUI and console versions are defined in a single spec file that
+    # shares one dependency analysis between the two executables
+    build_cmd = [
         "pyinstaller",
-        "--onefile",
-        "--windowed",
-        "--name", "WorkOrderChecker",
-        "--icon", "icon.ico" if Path("icon.ico").exists() else None,
-        "--add-data", "sample_data;sample_data",
-        "gui.py"
+        "--noconfirm",
+        SPEC_FILE
     ]
     
-    # Remove None values (in case icon doesn't exist)
-    gui_cmd = [arg for arg in gui_cmd if arg is not None]
+    # Compress the executables with UPX when it is installed
+    upx_path = shutil.which("upx")
+    if upx_path:
+        build_cmd[2:2] = ["--upx-dir", str(Path(upx_path).parent)]
     
-    # PyInstaller command for console version
-    console_cmd = [
-        "pyinstaller",
-        "--onefile",
-        "--name", "WorkOrderChecker-Console",
-        "--add-data", "sample_data;sample_data",
-        "main.py"
-    ]
-    
-    # Build GUI version
-    print("Building GUI version...")
-    subprocess.run(gui_cmd, check=True)
-    
-    # Build console version
-    print("Building console version...")
-    subprocess.run(console_cmd, check=True)
+    subprocess.run(build_cmd, check=True)
     
     print("Build completed!")
     print("Executables are in the 'dist' folder:")
-    print("  - WorkOrderChecker.exe (GUI version)")
+    print("  - WorkOrderChecker\\WorkOrderChecker.exe (GUI version)")
     print("  - WorkOrderChecker-Console.exe (Command line version)")
 
+def fast_copy(src, dst):
+    """Copy a single file to the destination file path using the OS-native routine."""
+    if os.name == "nt":
+        import ctypes
+        # CopyFileW copies data and attributes inside the kernel
+        if not ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+            raise ctypes.WinError()
+    else:
+        # shutil already uses sendfile()/fcopyfile() for in-kernel copies here
+        shutil.copy2(src, dst)
+
+def fast_copytree(src, dst):
+    """Copy a directory tree using robocopy on Windows or cp elsewhere."""
+    src = Path(src)
+    dst = Path(dst)
+    dst.mkdir(parents=True, exist_ok=True)
+    
+    if os.name == "nt":
+        cmd = ["robocopy", str(src), str(dst), "/S", "/MT:16", "/NFL", "/NDL", "/NJH", "/NJS"]
+        result = subprocess.run(cmd)
+        # robocopy exit codes below 8 all indicate success
+        if result.returncode >= 8:
+            raise subprocess.CalledProcessError(result.returncode, cmd)
+    else:
+        subprocess.run(["cp", "-a", f"{src}/.", str(dst)], check=True)
+
 def create_installer_package():
     """Create a complete installer package."""
     print("Creating installer package...")
@@ -75,21 +118,32 @@ def create_installer_package():
     package_folder = dist_folder / "WorkOrderChecker-Package"
     package_folder.mkdir(exist_ok=True)
     
-    # Copy executables
-    if (dist_folder / "WorkOrderChecker.exe").exists():
-        shutil.copy2(dist_folder / "WorkOrderChecker.exe", package_folder)
+    # List each source directory once and reuse the cached entries instead of
+    # stat-ing every candidate file separately
+    with os.scandir(dist_folder) as it:
+        dist_entries = {entry.name: entry for entry in it}
+    with os.scandir(".") as it:
+        project_entries = {entry.name: entry for entry in it}
+    
+    # Copy executables (the GUI is a onedir bundle, the console version a single file)
+    entry = dist_entries.get("WorkOrderChecker")
+    if entry is not None and entry.is_dir():
+        fast_copytree(entry.path, package_folder / "WorkOrderChecker")
     
-    if (dist_folder / "WorkOrderChecker-Console.exe").exists():
-        shutil.copy2(dist_folder / "WorkOrderChecker-Console.exe", package_folder)
+    entry = dist_entries.get("WorkOrderChecker-Console.exe")
+    if entry is not None and entry.is_file():
+        fast_copy(entry.path, package_folder / "WorkOrderChecker-Console.exe")
     
     # Copy documentation
     for file in ["README.md", "requirements.txt"]:
-        if Path(file).exists():
-            shutil.copy2(file, package_folder)
+        entry = project_entries.get(file)
+        if entry is not None and entry.is_file():
+            fast_copy(entry.path, package_folder / file)
     
     # Copy sample data
-    if Path("sample_data").exists():
-        shutil.copytree("sample_data", package_folder / "sample_data", dirs_exist_ok=True)
+    entry = project_entries.get("sample_data")
+    if entry is not None and entry.is_dir():
+        fast_copytree(entry.path, package_folder / "sample_data")
     
     # Create installation instructions
     install_instructions = """# Work Order Duplicate Checker - Installation Instructions
@@ -97,7 +151,7 @@ def create_installer_package():
 ## Quick Start
 
 1. **GUI Version (Recommended)**:
-   - Double-click `WorkOrderChecker.exe`
+   - Open the `WorkOrderChecker` folder and double-click `WorkOrderChecker.exe`
    - Drag and drop your work order files or use the "Add Files" button
    - Click "Check for Duplicates"
 
@@ -125,7 +179,11 @@ For issues or questions, visit: https://github.com/built-by-Beck/work-order-chec
     with open(package_folder / "INSTALLATION.md", "w", encoding="utf-8") as f:
         f.write(install_instructions)
     
+    # Zip the package so it can still be distributed as a single download
+    archive = shutil.make_archive(str(package_folder), "zip", root_dir=package_folder)
+    
     print(f"Package created in: {package_folder}")
+    print(f"Package archive: {archive}")
     print("Ready for distribution!")
 
 def main():
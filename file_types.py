@@ -0,0 +1,21 @@
+"""
+Supported work order file types
+
+Kept free of third-party imports so the GUI and the command line tool can
+filter files without loading the parsers.
+"""
+
+# Supported formats, grouped as they are listed to the user
+FILE_TYPE_GROUPS = (
+    ("Text files", (".txt",)),
+    ("CSV files", (".csv",)),
+    ("JSON files", (".json",)),
+    ("PDF files", (".pdf",)),
+    ("HTML files", (".html", ".htm")),
+    ("XML files", (".xml",)),
+    ("Excel files", (".xls", ".xlsx")),
+    ("Word files", (".doc", ".docx")),
+)
+
+# File extensions (lowercase) that can be loaded as work orders
+SUPPORTED_EXTENSIONS = frozenset(ext for _, group in FILE_TYPE_GROUPS for ext in group)
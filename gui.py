@@ -6,9 +6,13 @@ A user-friendly graphical interface for checking duplicate tasks across work ord
 Supports drag-and-drop functionality and multiple file formats.
 """
 
+import io
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from contextlib import ExitStack
 from pathlib import Path
 import sys
 import os
@@ -16,9 +20,11 @@ from typing import List
 import webbrowser
 
 # Add the current directory to the path so we can import our module
+# (work_order_checker is imported on demand: it pulls in pandas, PyPDF2, etc.,
+# which would otherwise delay the first window paint)
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from work_order_checker import WorkOrderChecker
+from file_types import FILE_TYPE_GROUPS, SUPPORTED_EXTENSIONS
 
 # Try to import tkinterdnd2 for drag-and-drop (optional)
 try:
@@ -27,6 +33,35 @@ try:
 except ImportError:
     HAS_DND = False
 
+# Minimum delay between status bar updates posted from worker threads
+STATUS_FLUSH_MS = 100
+
+# Formats whose parsers are CPU-bound enough to be worth a worker process
+# (each one starts by importing the parsing libraries). Everything else is
+# parsed on threads in the GUI process.
+PROCESS_POOL_EXTENSIONS = frozenset({'.pdf', '.xls', '.xlsx', '.doc', '.docx'})
+
+
+def _dialog_pattern(extensions):
+    """Build a file dialog pattern matching both lower and upper case extensions."""
+    return ";".join(f"*{ext};*{ext.upper()}" for ext in extensions)
+
+
+# File dialog filters, built once at import time
+FILE_DIALOG_TYPES = (
+    ("All Supported", _dialog_pattern(ext for _, group in FILE_TYPE_GROUPS for ext in group)),
+    *((label, _dialog_pattern(group)) for label, group in FILE_TYPE_GROUPS),
+    ("All files", "*.*"),
+)
+
+
+def _file_size(file_path):
+    """Return the size of a file in bytes, or 0 if it can't be read."""
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return 0
+
 
 class WorkOrderGUI:
     def __init__(self):
@@ -37,8 +72,14 @@ class WorkOrderGUI:
             self.root = tk.Tk()
         
         self.setup_ui()
-        self.checker = WorkOrderChecker()
-        self.files_to_check = []
+        self.checker = None  # Created by _create_checker() when a check runs
+        self.files_to_check = []  # (path, basename) pairs, in list order
+        self._files_set = set()  # Paths in files_to_check, for O(1) membership tests
+        
+        # Progress messages from worker threads are coalesced before hitting Tk
+        self._status_lock = threading.Lock()
+        self._pending_status = None
+        self._status_scheduled = False
         
     def setup_ui(self):
         """Set up the user interface."""
@@ -182,30 +223,14 @@ class WorkOrderGUI:
         
     def add_files(self):
         """Add individual files to the check list."""
-        filetypes = [
-            ("All Supported", "*.txt;*.csv;*.json;*.pdf;*.html;*.htm;*.HTM;*.xml;*.xls;*.xlsx;*.doc;*.docx"),
-            ("Text files", "*.txt"),
-            ("CSV files", "*.csv"),
-            ("JSON files", "*.json"),
-            ("PDF files", "*.pdf"),
-            ("HTML files", "*.html;*.htm;*.HTM"),
-            ("XML files", "*.xml"),
-            ("Excel files", "*.xls;*.xlsx"),
-            ("Word files", "*.doc;*.docx"),
-            ("All files", "*.*")
-        ]
-        
         files = filedialog.askopenfilenames(
             title="Select Work Order Files",
-            filetypes=filetypes
+            filetypes=FILE_DIALOG_TYPES
         )
         
-        for file in files:
-            if file not in self.files_to_check:
-                self.files_to_check.append(file)
-                self.file_listbox.insert(tk.END, Path(file).name)
+        added_count = self._add_paths(files)
         
-        self.update_status(f"Added {len(files)} file(s). Total: {len(self.files_to_check)} files")
+        self.update_status(f"Added {added_count} file(s). Total: {len(self.files_to_check)} files")
         
     def add_folder(self):
         """Add all supported files from a folder."""
@@ -213,35 +238,70 @@ class WorkOrderGUI:
         if not folder:
             return
         
-        folder_path = Path(folder)
-        supported_extensions = ['.txt', '.csv', '.json', '.pdf', '.html', '.htm', '.HTM',
-                              '.xml', '.xls', '.xlsx', '.doc', '.docx']
+        with os.scandir(folder) as entries:
+            folder_files = [
+                entry.path for entry in entries
+                if entry.is_file(follow_symlinks=False)
+                and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+            ]
         
-        added_count = 0
-        for file_path in folder_path.iterdir():
-            if file_path.is_file() and file_path.suffix in supported_extensions:
-                file_str = str(file_path)
-                if file_str not in self.files_to_check:
-                    self.files_to_check.append(file_str)
-                    self.file_listbox.insert(tk.END, file_path.name)
-                    added_count += 1
+        added_count = self._add_paths(folder_files)
         
         self.update_status(f"Added {added_count} file(s) from folder. Total: {len(self.files_to_check)} files")
         
+    def _add_paths(self, paths):
+        """Add new paths to the check list, skipping ones already present.
+        
+        Returns the number of paths that were actually added.
+        """
+        fresh = []
+        for path in paths:
+            # The folder scan, file dialog and drag-and-drop spell paths
+            # differently (e.g. mixed separators on Windows), so normalize
+            # before comparing
+            path = os.path.abspath(path)
+            if path not in self._files_set:
+                self._files_set.add(path)
+                fresh.append((path, os.path.basename(path)))
+        
+        if fresh:
+            self.files_to_check.extend(fresh)
+            # A single insert call adds every name in one Tcl round-trip
+            self.file_listbox.insert(tk.END, *[name for _, name in fresh])
+        
+        return len(fresh)
+        
     def remove_files(self):
         """Remove selected files from the list."""
-        selected_indices = list(self.file_listbox.curselection())
-        selected_indices.reverse()  # Remove from end to beginning to maintain indices
-        
+        selected_indices = sorted(self.file_listbox.curselection())
+        selected = set(selected_indices)
+        
+        # Rebuild the list in one pass instead of popping entries one at a time
+        kept = []
+        for index, (path, name) in enumerate(self.files_to_check):
+            if index in selected:
+                self._files_set.discard(path)
+            else:
+                kept.append((path, name))
+        self.files_to_check = kept
+        
+        # Delete each contiguous run of selected rows with a single Tcl call,
+        # working from the end so earlier indices stay valid
+        runs = []
         for index in selected_indices:
-            del self.files_to_check[index]
-            self.file_listbox.delete(index)
+            if runs and index == runs[-1][1] + 1:
+                runs[-1][1] = index
+            else:
+                runs.append([index, index])
+        for first, last in reversed(runs):
+            self.file_listbox.delete(first, last)
         
         self.update_status(f"Removed {len(selected_indices)} file(s). Total: {len(self.files_to_check)} files")
         
     def clear_files(self):
         """Clear all files from the list."""
         self.files_to_check.clear()
+        self._files_set.clear()
         self.file_listbox.delete(0, tk.END)
         self.results_text.delete(1.0, tk.END)
         self.export_btn.config(state=tk.DISABLED)
@@ -253,16 +313,7 @@ class WorkOrderGUI:
             return
         
         files = self.root.tk.splitlist(event.data)
-        added_count = 0
-        
-        for file in files:
-            file_path = Path(file)
-            if file_path.is_file():
-                file_str = str(file_path)
-                if file_str not in self.files_to_check:
-                    self.files_to_check.append(file_str)
-                    self.file_listbox.insert(tk.END, file_path.name)
-                    added_count += 1
+        added_count = self._add_paths([file for file in files if os.path.isfile(file)])
         
         self.update_status(f"Dropped {added_count} file(s). Total: {len(self.files_to_check)} files")
         
@@ -283,25 +334,61 @@ class WorkOrderGUI:
         thread.daemon = True
         thread.start()
         
+    def _create_checker(self):
+        """Create a fresh checker, importing the parsing backends on first use."""
+        from work_order_checker import WorkOrderChecker
+        return WorkOrderChecker()
+        
     def _check_duplicates_thread(self):
         """Thread function to check duplicates without blocking the UI."""
         try:
             # Reset the checker
-            self.checker = WorkOrderChecker()
+            self.checker = self._create_checker()
+            from work_order_checker import _parse_dispatch
             
-            # Load all files
+            files = list(self.files_to_check)
+            total = len(files)
             loaded_count = 0
-            failed_files = []
+            parsed = {}
+            failures = {}
+            
+            heavy, light = [], []
+            for index, (path, _) in enumerate(files):
+                if os.path.splitext(path)[1].lower() in PROCESS_POOL_EXTENSIONS:
+                    heavy.append(index)
+                else:
+                    light.append(index)
             
-            for file_path in self.files_to_check:
-                try:
-                    self.checker.load_work_order(Path(file_path))
-                    loaded_count += 1
-                    # Update UI in main thread
-                    self.root.after(0, self.update_status, 
-                                  f"Loaded {loaded_count}/{len(self.files_to_check)} files...")
-                except Exception as e:
-                    failed_files.append((Path(file_path).name, str(e)))
+            with ThreadPoolExecutor() as threads, ExitStack() as stack:
+                futures = {}
+                if heavy:
+                    # Worker processes are started with spawn: forking from this
+                    # thread while Tk runs on the main thread is unsafe
+                    processes = stack.enter_context(ProcessPoolExecutor(
+                        max_workers=min(os.cpu_count() or 1, len(heavy)),
+                        mp_context=multiprocessing.get_context('spawn'),
+                    ))
+                    # Submit the largest files first so the slowest parses start
+                    # early and the pool doesn't finish on one long straggler
+                    for index in sorted(heavy, key=lambda i: _file_size(files[i][0]), reverse=True):
+                        futures[processes.submit(_parse_dispatch, files[index][0])] = index
+                for index in light:
+                    futures[threads.submit(self.checker.parse_work_order, files[index][0])] = index
+                
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        parsed[index] = future.result()
+                        loaded_count += 1
+                    except Exception as e:
+                        failures[index] = (files[index][1], str(e))
+                    
+                    self._post_status(f"Loaded {loaded_count}/{total} files...")
+            
+            # Index results in the original file order so output is deterministic
+            for index in sorted(parsed):
+                self.checker.add_work_order(parsed[index])
+            failed_files = [failures[index] for index in sorted(failures)]
             
             # Find duplicates
             duplicates = self.checker.find_duplicates()
@@ -317,53 +404,53 @@ class WorkOrderGUI:
             
     def _display_results(self, duplicates, stats, loaded_count, failed_files):
         """Display the results in the UI."""
-        results = []
+        buf = io.StringIO()
+        w = buf.write
         
         # Header
-        results.append("=" * 60)
-        results.append("WORK ORDER DUPLICATE CHECK RESULTS")
-        results.append("=" * 60)
-        results.append("")
+        w("=" * 60 + "\n")
+        w("WORK ORDER DUPLICATE CHECK RESULTS\n")
+        w("=" * 60 + "\n")
+        w("\n")
         
         # Summary
-        results.append("SUMMARY:")
-        results.append(f"  Files processed: {loaded_count}")
-        results.append(f"  Total work orders: {stats['work_orders_count']}")
-        results.append(f"  Total tasks: {stats['total_tasks']}")
-        results.append(f"  Unique tasks: {stats['unique_tasks']}")
-        results.append(f"  Duplicate tasks found: {len(duplicates)}")
+        w("SUMMARY:\n")
+        w(f"  Files processed: {loaded_count}\n")
+        w(f"  Total work orders: {stats['work_orders_count']}\n")
+        w(f"  Total tasks: {stats['total_tasks']}\n")
+        w(f"  Unique tasks: {stats['unique_tasks']}\n")
+        w(f"  Duplicate tasks found: {len(duplicates)}\n")
         if stats['unique_tasks'] > 0:
-            results.append(f"  Duplication rate: {stats['duplication_rate']:.1f}%")
-        results.append("")
+            w(f"  Duplication rate: {stats['duplication_rate']:.1f}%\n")
+        w("\n")
         
         # Failed files
         if failed_files:
-            results.append("FAILED TO LOAD:")
+            w("FAILED TO LOAD:\n")
             for filename, error in failed_files:
-                results.append(f"  ✗ {filename}: {error}")
-            results.append("")
+                w(f"  ✗ {filename}: {error}\n")
+            w("\n")
         
         # Duplicates
         if duplicates:
-            results.append(f"🚨 DUPLICATE TASKS FOUND ({len(duplicates)}):")
-            results.append("-" * 60)
+            w(f"🚨 DUPLICATE TASKS FOUND ({len(duplicates)}):\n")
+            w("-" * 60 + "\n")
             
             for i, duplicate in enumerate(duplicates, 1):
-                results.append(f"\nDuplicate #{i}:")
-                results.append(f"  Task: {duplicate['task']}")
-                results.append(f"  Equipment ID: {duplicate['task_id']}")
-                results.append(f"  Found in {duplicate['count']} work orders:")
+                w(f"\nDuplicate #{i}:\n")
+                w(f"  Task: {duplicate['task']}\n")
+                w(f"  Equipment ID: {duplicate['task_id']}\n")
+                w(f"  Found in {duplicate['count']} work orders:\n")
                 for wo_name in duplicate['work_orders']:
-                    results.append(f"    - {wo_name}")
-                results.append("-" * 40)
+                    w(f"    - {wo_name}\n")
+                w("-" * 40 + "\n")
         else:
-            results.append("✅ NO DUPLICATE TASKS FOUND!")
-            results.append("All work orders contain unique tasks.")
+            w("✅ NO DUPLICATE TASKS FOUND!\n")
+            w("All work orders contain unique tasks.\n")
         
-        # Display results
-        result_text = "\n".join(results)
+        # Display results with a single insert (and a single layout pass)
         self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(1.0, result_text)
+        self.results_text.insert(1.0, buf.getvalue())
         
         # Enable export if we have results
         self.export_btn.config(state=tk.NORMAL if duplicates else tk.DISABLED)
@@ -383,6 +470,9 @@ class WorkOrderGUI:
         
     def _finish_check(self):
         """Finish the duplicate check process."""
+        # Drop any queued progress message so it can't overwrite the final status
+        with self._status_lock:
+            self._pending_status = None
         self.progress.stop()
         self.check_btn.config(state=tk.NORMAL)
         
@@ -411,6 +501,28 @@ class WorkOrderGUI:
         """Update the status bar."""
         self.status_var.set(message)
         
+    def _post_status(self, message):
+        """Queue a status bar update from a worker thread.
+        
+        Only the latest message is kept, and the main loop applies it at most
+        once every STATUS_FLUSH_MS milliseconds.
+        """
+        with self._status_lock:
+            self._pending_status = message
+            if self._status_scheduled:
+                return
+            self._status_scheduled = True
+        self.root.after(STATUS_FLUSH_MS, self._flush_status)
+        
+    def _flush_status(self):
+        """Apply the most recent queued status message (runs in the main thread)."""
+        with self._status_lock:
+            message = self._pending_status
+            self._pending_status = None
+            self._status_scheduled = False
+        if message is not None:
+            self.update_status(message)
+        
     def show_about(self):
         """Show about dialog."""
         about_text = """Work Order Duplicate Checker v1.0
@@ -447,4 +559,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Needed for worker processes in frozen builds
     main()
\ No newline at end of file
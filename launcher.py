@@ -6,40 +6,93 @@ This script can be used to create desktop shortcuts
 
 import sys
 import os
+import importlib.util
+import multiprocessing
 from pathlib import Path
 
 # Add the script directory to Python path
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 
-try:
-    from gui import main
-    main()
-except ImportError as e:
+# Optional third-party modules behind each file format, as alternative sets of
+# modules; a format is available when every module of any one set is
+# installed. These are located with find_spec, which does not execute them,
+# so the check doesn't pay for importing the heavy modules that are
+# installed. Only tkinter is required.
+FORMAT_MODULES = (
+    ('Excel (.xlsx)', (('pandas', 'openpyxl'),)),
+    ('Excel (.xls)', (('pandas', 'xlrd'),)),
+    ('PDF (.pdf)', (('pypdfium2',), ('PyPDF2',))),
+    ('HTML (.html, .htm)', (('selectolax',), ('bs4',))),
+    ('Word (.docx)', (('docx',),)),
+)
+
+
+def show_error(title, message):
+    """Show an error dialog without opening the main application window."""
     import tkinter as tk
     from tkinter import messagebox
     
     root = tk.Tk()
     root.withdraw()  # Hide the main window
     
-    messagebox.showerror(
-        "Missing Dependencies",
-        f"Required modules are not installed.\n\n"
-        f"Error: {e}\n\n"
-        f"Please run 'install_windows.bat' first to install dependencies."
-    )
-    
-    sys.exit(1)
-except Exception as e:
+    messagebox.showerror(title, message)
+
+
+def show_warning(title, message):
+    """Show a warning dialog, then tear down its hidden root so the GUI can start."""
     import tkinter as tk
     from tkinter import messagebox
     
     root = tk.Tk()
     root.withdraw()  # Hide the main window
     
-    messagebox.showerror(
-        "Application Error",
-        f"An error occurred while starting the application:\n\n{e}"
-    )
+    messagebox.showwarning(title, message)
+    root.destroy()
+
+
+def unavailable_formats():
+    """Return the file formats that none of their module sets can load."""
+    return [label for label, alternatives in FORMAT_MODULES
+            if not any(all(importlib.util.find_spec(name) is not None for name in modules)
+                       for modules in alternatives)]
+
+
+def main():
+    """Warn about unavailable file formats and start the GUI."""
+    unavailable = unavailable_formats()
+    if unavailable:
+        formats = "\n".join(unavailable)
+        show_warning(
+            "Some File Formats Unavailable",
+            f"These file formats can't be loaded because their modules are not installed:\n\n"
+            f"{formats}\n\n"
+            "Run 'install_windows.bat' to install them. Other formats work as usual."
+        )
     
-    sys.exit(1)
\ No newline at end of file
+    try:
+        from gui import main as gui_main
+        gui_main()
+    except ImportError as e:
+        show_error(
+            "Missing Dependencies",
+            f"Required modules are not installed.\n\n"
+            f"Error: {e}\n\n"
+            f"Please run 'install_windows.bat' first to install dependencies."
+        )
+        
+        sys.exit(1)
+    except Exception as e:
+        show_error(
+            "Application Error",
+            f"An error occurred while starting the application:\n\n{e}"
+        )
+        
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    # Worker processes re-import this script; freeze_support() handles them in
+    # frozen builds and the __main__ guard keeps them from opening the GUI
+    multiprocessing.freeze_support()
+    main()
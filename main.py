@@ -12,6 +12,7 @@ Usage: python main.py [work_order_files...]
 import sys
 import os
 from pathlib import Path
+from file_types import SUPPORTED_EXTENSIONS
 from work_order_checker import WorkOrderChecker
 
 
@@ -33,11 +34,13 @@ def main():
         if path.is_file():
             files_to_check.append(path)
         elif path.is_dir():
-            # Add all supported file types in the directory
-            supported_extensions = ['*.txt', '*.csv', '*.json', '*.pdf', '*.html', '*.htm', '*.HTM',
-                                  '*.xml', '*.xls', '*.xlsx', '*.doc', '*.docx']
-            for pattern in supported_extensions:
-                files_to_check.extend(path.glob(pattern))
+            # Add all supported file types in the directory (one directory scan)
+            with os.scandir(path) as entries:
+                files_to_check.extend(
+                    Path(entry.path) for entry in entries
+                    if entry.is_file()
+                    and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+                )
         else:
             print(f"Warning: {arg} is not a valid file or directory")
     
@@ -45,15 +48,17 @@ def main():
         print("No valid work order files found.")
         return 1
     
+    # Process the smallest files first so progress is reported as early as possible
+    files_to_check.sort(key=lambda p: p.stat().st_size)
+    
     print(f"Checking {len(files_to_check)} work order files for duplicates...")
     
     # Load and analyze work orders
-    for file_path in files_to_check:
-        try:
-            checker.load_work_order(file_path)
+    for file_path, work_order, error in checker.load_work_orders_batch(files_to_check):
+        if error is None:
             print(f"✓ Loaded: {file_path.name}")
-        except Exception as e:
-            print(f"✗ Error loading {file_path.name}: {e}")
+        else:
+            print(f"✗ Error loading {file_path.name}: {error}")
     
     # Find and report duplicates
     duplicates = checker.find_duplicates()
@@ -7,10 +7,22 @@ Supports multiple file formats: TXT, CSV, JSON, PDF, HTML, XML, XLS, XLSX, DOC,
 """
 
 import re
+import sys
 import json
 import csv
+import os
+import hashlib
+import pickle
+import tempfile
+import itertools
+import threading
+import time
+from functools import partial, lru_cache
+from html import unescape as unescape_html
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Set, Any
+from typing import List, Dict, Set, Any, Tuple, Iterable, Iterator, Optional
 from dataclasses import dataclass
 
 # Optional imports for different file formats
@@ -26,12 +38,37 @@ try:
 except ImportError:
     HAS_PDF = False
 
+# Preferred PDF text extractor: PDFium (C++) is several times faster than PyPDF2
+try:
+    import pypdfium2 as pdfium
+    HAS_PDFIUM = True
+except ImportError:
+    HAS_PDFIUM = False
+
+# Serializes every call into PDFium, which must not be used from several
+# threads at once (load_work_orders_batch parses files on a thread pool)
+_PDFIUM_LOCK = threading.Lock()
+
 try:
     from bs4 import BeautifulSoup
     HAS_BS4 = True
 except ImportError:
     HAS_BS4 = False
 
+# Preferred HTML backend: selectolax's lexbor parser builds the tree and runs
+# the CSS query in C. Otherwise BeautifulSoup is used, on lxml when available.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+try:
+    import lxml  # Only used as a BeautifulSoup tree builder
+    _BS4_FEATURES = 'lxml'
+except ImportError:
+    _BS4_FEATURES = 'html.parser'
+
 try:
     from docx import Document
     HAS_DOCX = True
@@ -44,15 +81,375 @@ try:
 except ImportError:
     HAS_XML = False
 
+# Optional fast JSON decoder (Rust); the stdlib json module is used otherwise
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-@dataclass
+# Optional DFA-based regex engine (google-re2) for scanning large, sparse text files
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+
+def _default_cache_dir() -> Path:
+    """Return the per-user cache directory: %LOCALAPPDATA% on Windows, XDG elsewhere."""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA')
+        return (Path(base) if base else Path.home() / "AppData" / "Local") / "work-order-checker" / "cache"
+    base = os.environ.get('XDG_CACHE_HOME')
+    return (Path(base) if base else Path.home() / ".cache") / "work-order-checker"
+
+
+# Parsed work orders are cached here, so files that haven't changed since the
+# last run are not parsed again. Bump the version whenever parser output or
+# the pickled classes change.
+DEFAULT_CACHE_DIR = _default_cache_dir()
+_PARSE_CACHE_VERSION = 3
+# Entries unused for this long are deleted, and only this many of the most
+# recently used are kept, so exports that are never loaded again don't pile up
+_CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+_CACHE_MAX_ENTRIES = 1000
+# Cache directories already pruned by this process
+_pruned_cache_dirs: Set[Path] = set()
+
+# Whitespace characters, exactly as Python's re treats \s in str patterns.
+# The text task pattern spells these out instead of using \s/\S so that it
+# means the same under RE2, whose \s only covers ASCII whitespace.
+_SPACE_CHARS = ('\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003'
+                '\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000')
+_LINE_SPACE = '[' + _SPACE_CHARS.replace('\n', '') + ']'  # Whitespace that stays on the line
+_NON_SPACE = '[^' + _SPACE_CHARS + ']'
+
+
+# Precompiled patterns used by the parsers and task normalization
+# Task lines in a plain text work order, matched in a single pass over the file.
+# Each match is one whole line holding either an equipment task with a location
+# (e.g. "exit lights [212934] MOB B - ground floor") or, failing that, any
+# "description [ID] location" task.
+_TEXT_TASK_PATTERN = (
+    r'(?im)^{ls}*(?:'
+    r'(?P<etype>exit lights?|emergency lighting?|fire extinguisher){ls}*'
+    r'\[(?P<eid>[^\]\n]+)\]{ls}*(?P<eloc>.*{ns})'
+    r'|(?P<gdesc>{ns}.*?)\[(?P<gid>[^\]\n]+)\](?P<gloc>.*{ns})'
+    r'){ls}*$'
+).format(ls=_LINE_SPACE, ns=_NON_SPACE)
+_TEXT_TASK_RE = re.compile(_TEXT_TASK_PATTERN)
+_TEXT_TASK_RE2 = re2.compile(_TEXT_TASK_PATTERN) if HAS_RE2 else None
+# RE2 scans several times faster than re, but its Python binding costs about
+# ten times more per match, so it only wins on files where task lines are
+# sparse. Every task line has a "[", which gives a cheap upper bound.
+_RE2_MIN_CHARS_PER_BRACKET = 1024
+# Text files are scanned in blocks of about this many characters, cut at line
+# boundaries, so memory use stays flat for multi-megabyte exports
+_TEXT_BLOCK_CHARS = 1 << 20
+# "description [ID] location" where the ID is numeric (PDF, XML and Word exports)
+_NUMERIC_TASK_RE = re.compile(r'(.+?)\[(\d+)\](.+)')
+# Equipment entry inside an HTML report cell (kept on re: its \w and \s are
+# Unicode-aware, which RE2 can't reproduce)
+_HTML_EQUIP_RE = re.compile(
+    r'(Exit Lights?|Fire Extinguishers?|Emergency Lights?)(?:\s+[\w-]+)?\s*\[([^\]]+)\]\s*(.+?)'
+    r'(?:\s*MAIN HOSPITAL|\s*Equipment Lists|\s*Exit Lights?|$)',
+    re.IGNORECASE
+)
+# Regex scan of HTML report cells (the fast path of _html_cell_texts); tag
+# patterns allow quoted attribute values that contain ">"
+_HTML_TD_OPEN_RE = re.compile(r'''<td\b((?:[^>"']|"[^"]*"|'[^']*')*)>''', re.IGNORECASE)
+_HTML_CLASS_ATTR_RE = re.compile(r'''(?:^|\s)class\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))''', re.IGNORECASE)
+# Where a cell's content ends: its own </td>, or a table tag meaning the cell
+# is unclosed or nests another table
+_HTML_CELL_END_RE = re.compile(r'</td\s*>|</?(?:td|th|tr|table|thead|tbody|tfoot)\b', re.IGNORECASE)
+# Comments, other <!...> declarations (CDATA, doctype), processing
+# instructions and script/style blocks, whose contents are not markup
+_HTML_RAW_BLOCK_RE = re.compile(r'<!--.*?-->|<!.*?>|<\?.*?>|<(script|style)\b.*?</\1\s*>',
+                                re.DOTALL | re.IGNORECASE)
+# Comments and tags inside a cell; the text between them forms the text nodes
+_HTML_MARKUP_RE = re.compile(r'''<!--.*?-->|</?[a-zA-Z](?:[^>"']|"[^"]*"|'[^']*')*>''', re.DOTALL)
+# Markup left in a cell's text once its comments and tags are split out:
+# CDATA, processing instructions, or a tag or comment cut short because the
+# cell end was found inside it (e.g. "</td>" in a quoted attribute value)
+_HTML_LEFTOVER_MARKUP_RE = re.compile(r'<[!/?a-zA-Z]')
+_ID_BRACKET_RE = re.compile(r'\[([^\]]+)\]')
+_DIGITS_RE = re.compile(r'\d+')
+_WS_RE = re.compile(r'\s+')
+_TRAILING_PUNCT_RE = re.compile(r'[,\.\-:]+$')
+_TRAILING_COLON_RE = re.compile(r':\s*$')
+
+# Common location abbreviations and their full forms (case-insensitive)
+# Add more as needed based on your facility's naming conventions
+_ABBREVIATIONS = [
+    (re.compile(pattern, re.IGNORECASE), full_form)
+    for pattern, full_form in [
+        (r'\bwmc\b', "women's medical center"),
+        (r"\bwomen'?s?\s+med(?:ical)?\s+(?:ctr|center)\b", "women's medical center"),
+        (r'\bmob\s*([a-z])\b', r'medical office building \1'),
+        (r'\ber\b', 'emergency room'),
+        (r'\bicu\b', 'intensive care unit'),
+        (r'\bor\b', 'operating room'),
+        (r'\bpacu\b', 'post anesthesia care unit'),
+        (r'\bnicu\b', 'neonatal intensive care unit'),
+        (r'\bccu\b', 'cardiac care unit'),
+        (r'\bpicu\b', 'pediatric intensive care unit'),
+    ]
+]
+
+
+@lru_cache(maxsize=65536)
+def _normalize_location(location: str) -> str:
+    """Normalize a task location for comparison.
+    
+    Work orders repeat the same few locations across many tasks, so results
+    are cached; this skips the whitespace and abbreviation regexes for all
+    but the first occurrence of each location.
+    """
+    # Normalize location: lowercase, single spaces, remove punctuation
+    location = location.lower().strip()
+    location = _WS_RE.sub(' ', location)  # Normalize whitespace
+    location = _TRAILING_PUNCT_RE.sub('', location)  # Remove trailing punctuation
+    
+    # Expand common abbreviations to handle cases like "WMC" vs "Women's Medical Center",
+    # so duplicates are found when work orders use abbreviations vs. full names
+    for abbrev_re, full_form in _ABBREVIATIONS:
+        location = abbrev_re.sub(full_form, location)
+    
+    return location
+
+
+def _parser_fingerprint(fast_html: bool) -> str:
+    """Fingerprint the settings that shape parser output, for the parse cache key.
+    
+    Cached work orders hold normalized task keys and backend-specific text, so
+    an entry is only reused under the same abbreviation table, HTML mode and
+    PDF/HTML backends it was parsed with.
+    """
+    state = (
+        [(abbrev_re.pattern, abbrev_re.flags, full_form) for abbrev_re, full_form in _ABBREVIATIONS],
+        fast_html, HAS_PDFIUM, HAS_PDF, HAS_SELECTOLAX, HAS_BS4, _BS4_FEATURES,
+    )
+    return hashlib.sha256(repr(state).encode('utf-8')).hexdigest()
+
+def _prune_cache(cache_dir: Path) -> None:
+    """Delete stale and excess parse cache entries (best effort).
+    
+    Entries are ordered by modification time, which a cache hit refreshes,
+    so the least recently used ones go first.
+    """
+    entries = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.pkl'):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        pass
+    except OSError:
+        return
+    
+    entries.sort(reverse=True)
+    cutoff = time.time() - _CACHE_MAX_AGE_SECONDS
+    for index, (mtime, path) in enumerate(entries):
+        if index >= _CACHE_MAX_ENTRIES or mtime < cutoff:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+def _read_line_blocks(file, block_chars: int):
+    """Yield successive chunks of an open text file, each ending on a line break."""
+    tail = ''
+    while True:
+        block = file.read(block_chars)
+        if not block:
+            if tail:
+                yield tail
+            return
+        block = tail + block
+        cut = block.rfind('\n') + 1
+        if cut:
+            tail = block[cut:]
+            yield block[:cut]
+        else:
+            # No line break yet; keep reading until the line is complete
+            tail = block
+
+
+def _load_json(raw: bytes) -> Any:
+    """Decode a UTF-8 JSON document, using orjson when available."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (no NaN/Infinity, 64-bit integers
+            # only), so let the stdlib decide whether the document is valid
+            pass
+    return json.loads(raw.decode('utf-8'))
+
+
+def _pdf_page_texts(file_path: Path) -> Iterator[str]:
+    """Yield the extracted text of each page of a PDF, using PDFium when available."""
+    if HAS_PDFIUM:
+        # PDFium is not thread-safe, so the whole document is read under the
+        # lock and the texts are yielded only after it has been released
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(str(file_path))
+            try:
+                texts = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    texts.append(textpage.get_text_range())
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
+        yield from texts
+        return
+    
+    with open(file_path, 'rb') as file:
+        for page in PdfReader(file).pages:
+            yield page.extract_text()
+
+
+def _iter_xml_texts(file_path: Path) -> Iterator[str]:
+    """Yield the stripped, non-empty text of each XML element in document order.
+    
+    The file is streamed with iterparse. An element's text is complete once
+    its first child starts (or, for a leaf, once it ends), so it's yielded
+    then, and each element is dropped from its parent as soon as it ends.
+    Memory therefore stays proportional to the nesting depth, not the file.
+    """
+    stack = []  # [element, text_yielded] for each open element
+    for event, element in ET.iterparse(str(file_path), events=('start', 'end')):
+        if event == 'start':
+            if stack and not stack[-1][1]:
+                parent = stack[-1]
+                parent[1] = True
+                if parent[0].text and parent[0].text.strip():
+                    yield parent[0].text.strip()
+            stack.append([element, False])
+        else:
+            _, text_yielded = stack.pop()
+            if not text_yielded and element.text and element.text.strip():
+                yield element.text.strip()
+            element.clear()
+            if stack:
+                stack[-1][0].remove(element)
+
+
+def _scan_html_cell_texts(html: str) -> Optional[List[str]]:
+    """Extract the data_underline cell texts with regexes, without building a DOM.
+    
+    Report exports use plain, closed cells, which a regex scan handles exactly.
+    Returns None if any such cell is unclosed, nests a table, holds script,
+    style, CDATA or processing instructions, or has a </td inside a comment
+    or attribute value (or its class attribute is ambiguous), so the caller
+    can fall back to an HTML parser.
+    """
+    # A cell tag inside a comment or script would be picked up by the scan,
+    # and a closing one would cut a cell short
+    for block in _HTML_RAW_BLOCK_RE.finditer(html):
+        block = block.group().lower()
+        if '<td' in block or '</td' in block:
+            return None
+    
+    texts = []
+    for td in _HTML_TD_OPEN_RE.finditer(html):
+        attrs = td.group(1)
+        if 'data_underline' not in attrs and '&' not in attrs:
+            continue
+        class_attrs = _HTML_CLASS_ATTR_RE.findall(attrs)
+        if len(class_attrs) != 1:
+            # No class (the name is in another attribute) or a repeated class
+            # attribute, which parsers resolve differently
+            if not class_attrs:
+                continue
+            return None
+        class_names = ''.join(class_attrs[0])
+        if '&' in class_names:
+            # Character references in the class would need decoding first
+            return None
+        if 'data_underline' not in class_names.split():
+            continue
+        
+        end = _HTML_CELL_END_RE.search(html, td.end())
+        if end is None or not end.group().lower().startswith('</td'):
+            return None
+        content = html[td.end():end.start()]
+        
+        if '<' not in content:
+            # A single text node
+            texts.append(unescape_html(content).strip())
+            continue
+        lowered = content.lower()
+        if '<script' in lowered or '<style' in lowered:
+            return None
+        pieces = _HTML_MARKUP_RE.split(content)
+        if any(_HTML_LEFTOVER_MARKUP_RE.search(piece) for piece in pieces):
+            return None
+        texts.append(' '.join(text for text in (
+            unescape_html(piece).strip() for piece in pieces
+        ) if text))
+    
+    return texts
+
+
+def _html_cell_texts(html: str, fast: bool = True) -> List[str]:
+    """Return the text of every <td class="data_underline"> cell in an HTML report.
+    
+    Text matches BeautifulSoup's get_text(separator=' ', strip=True): the
+    stripped, non-empty text nodes joined by single spaces, leaving out
+    comments and script/style contents.
+    
+    selectolax is used when installed. Otherwise, with fast=True, a regex scan
+    is tried before BeautifulSoup; it is several times faster than building a
+    BeautifulSoup tree, and documents it can't handle exactly are handed on.
+    """
+    if HAS_SELECTOLAX:
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(['script', 'style'])
+        return [
+            ' '.join(text for text in (
+                node.text_content.strip()
+                for node in cell.traverse(include_text=True) if node.tag == '-text'
+            ) if text)
+            for cell in tree.css('td.data_underline')
+        ]
+    
+    if fast:
+        texts = _scan_html_cell_texts(html)
+        if texts is not None:
+            return texts
+    
+    soup = BeautifulSoup(html, _BS4_FEATURES)
+    return [cell.get_text(separator=' ', strip=True)
+            for cell in soup.find_all('td', class_='data_underline')]
+
+
+@dataclass(eq=False)
 class Task:
     """Represents a single task from a work order."""
+    # Large loads create many Tasks; slots drop the per-instance __dict__.
+    # (Declared by hand: dataclass(slots=True) needs Python 3.10.)
+    __slots__ = ('id', 'description', 'location', 'raw_text', '_norm')
+    
     id: str
     description: str
     location: str
     raw_text: str
     
+    def __post_init__(self):
+        # Work orders often repeat the same task text, so intern the raw text
+        # and key: repeats share one string, and index lookups on an
+        # identical key succeed on the identity check
+        self.raw_text = sys.intern(self.raw_text)
+        # Tasks are used as dict keys, so the normalized key is needed on every
+        # hash and equality check; compute it once instead of re-running the regexes
+        self._norm = sys.intern(self._compute_normalized())
+    
     def normalize(self) -> str:
         """Return a normalized version of the task for comparison.
 
@@ -63,8 +460,12 @@ class Task:
         Note: We do NOT compare task descriptions, as different workers might
         describe the same location/equipment differently.
         """
+        return self._norm
+    
+    def _compute_normalized(self) -> str:
+        """Build the normalized comparison key returned by normalize()."""
         # Extract part/equipment ID in brackets (e.g., [212934])
-        equipment_match = re.search(r'\[([^\]]+)\]', self.raw_text)
+        equipment_match = _ID_BRACKET_RE.search(self.raw_text) if '[' in self.raw_text else None
         part_number = equipment_match.group(1).strip() if equipment_match else ""
 
         # Extract location information (everything after the brackets)
@@ -74,13 +475,7 @@ class Task:
             # Fallback to stored location or description
             location = self.location or self.description
 
-        # Normalize location: lowercase, single spaces, remove punctuation
-        location = location.lower().strip()
-        location = re.sub(r'\s+', ' ', location)  # Normalize whitespace
-        location = re.sub(r'[,\.\-:]+$', '', location)  # Remove trailing punctuation
-        
-        # Expand common abbreviations to handle cases like "WMC" vs "Women's Medical Center"
-        location = self._expand_abbreviations(location)
+        location = _normalize_location(location)
 
         # Create a normalized key: part_number|location
         # Both must match for a duplicate (if part_number exists)
@@ -92,40 +487,13 @@ class Task:
 
         return normalized
     
-    def _expand_abbreviations(self, location: str) -> str:
-        """Expand common location abbreviations to their full forms.
-        
-        This helps identify duplicates when different work orders use
-        abbreviations vs. full names for the same location.
-        """
-        # Define common abbreviations (case-insensitive)
-        # Add more as needed based on your facility's naming conventions
-        abbreviations = {
-            r'\bwmc\b': "women's medical center",
-            r"\bwomen'?s?\s+med(?:ical)?\s+(?:ctr|center)\b": "women's medical center",
-            r'\bmob\s*([a-z])\b': r'medical office building \1',
-            r'\ber\b': 'emergency room',
-            r'\bicu\b': 'intensive care unit',
-            r'\bor\b': 'operating room',
-            r'\bpacu\b': 'post anesthesia care unit',
-            r'\bnicu\b': 'neonatal intensive care unit',
-            r'\bccu\b': 'cardiac care unit',
-            r'\bpicu\b': 'pediatric intensive care unit',
-        }
-        
-        # Apply each abbreviation expansion
-        for abbrev_pattern, full_form in abbreviations.items():
-            location = re.sub(abbrev_pattern, full_form, location, flags=re.IGNORECASE)
-        
-        return location
-    
     def __hash__(self):
-        return hash(self.normalize())
+        return hash(self._norm)
     
     def __eq__(self, other):
         if not isinstance(other, Task):
             return False
-        return self.normalize() == other.normalize()
+        return self._norm == other._norm
 
 
 @dataclass
@@ -142,17 +510,150 @@ class WorkOrder:
 class WorkOrderChecker:
     """Main class for checking work order duplicates."""
     
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[Path] = DEFAULT_CACHE_DIR, fast_html: bool = True):
+        """Create a checker.
+        
+        Pass cache_dir=None to disable the parse cache, and fast_html=False to
+        always parse HTML reports into a DOM instead of trying a regex scan first.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.fast_html = fast_html
         self.work_orders: List[WorkOrder] = []
-        self.all_tasks: Dict[Task, List[str]] = {}  # Task -> List of work order names
+        # Normalized task key -> (first Task seen, list of work order names)
+        self.all_tasks: Dict[str, Tuple[Task, List[str]]] = {}
+        # Running totals kept up to date by add_work_order for get_statistics
+        self._total_tasks = 0
+        self._duplicate_tasks = 0  # Keys seen more than once
     
     def load_work_order(self, file_path: Path) -> WorkOrder:
         """Load a work order from a file."""
+        work_order = self.parse_work_order(file_path)
+        self.add_work_order(work_order)
+        return work_order
+    
+    def load_work_orders_batch(self, file_paths: Iterable[Path], max_workers: Optional[int] = None
+                               ) -> List[Tuple[Path, Optional[WorkOrder], Optional[Exception]]]:
+        """Load several work order files, overlapping their disk reads.
+        
+        Files are parsed on a thread pool so one file's I/O proceeds while
+        another is being parsed. Every file is loaded and added to the checker
+        before this returns. Returns one result per file, in input order:
+        (file_path, work_order, None), or (file_path, None, error) for a file
+        that failed to load.
+        """
+        file_paths = list(file_paths)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return self._load_with_executor(executor, self.parse_work_order, file_paths)
+    
+    def load_many(self, file_paths: Iterable[Path], max_workers: Optional[int] = None
+                  ) -> List[Tuple[Path, Optional[WorkOrder], Optional[Exception]]]:
+        """Load several work order files, parsing them in worker processes.
+        
+        Use this for CPU-heavy formats (PDF, HTML, Excel, Word), whose parsers
+        would otherwise serialize on the GIL. Every file is added to the
+        checker before this returns; results are returned in input order, as
+        with load_work_orders_batch().
+        """
+        file_paths = list(file_paths)
+        if not file_paths:
+            return []
+        
+        if max_workers is None:
+            max_workers = min(os.cpu_count() or 1, len(file_paths))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return self._load_with_executor(
+                executor, partial(_parse_dispatch, cache_dir=self.cache_dir, fast_html=self.fast_html), file_paths
+            )
+    
+    def _load_with_executor(self, executor, parse, file_paths: List[Path]
+                            ) -> List[Tuple[Path, Optional[WorkOrder], Optional[Exception]]]:
+        """Parse files on an executor, then index them and return the results in order."""
+        futures = [executor.submit(parse, path) for path in file_paths]
+        results = []
+        for file_path, future in zip(file_paths, futures):
+            try:
+                work_order = future.result()
+            except Exception as e:
+                results.append((file_path, None, e))
+                continue
+            self.add_work_order(work_order)
+            results.append((file_path, work_order, None))
+        return results
+    
+    def parse_work_order(self, file_path: Path) -> WorkOrder:
+        """Parse a work order file without adding it to the checker.
+        
+        Parsing does not touch any checker state, so it is safe to call from
+        worker threads and merge the results with add_work_order afterwards.
+        """
         file_path = Path(file_path)
         
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
+        if self.cache_dir is None:
+            return self._parse_file(file_path)
+        
+        # One cache entry per file; it is reused only while the file's
+        # modification time and size and the parser settings are unchanged
+        stat = file_path.stat()
+        abs_path = os.path.abspath(file_path)
+        key = (_PARSE_CACHE_VERSION, _parser_fingerprint(self.fast_html),
+               abs_path, stat.st_mtime_ns, stat.st_size)
+        cache_file = self.cache_dir / (hashlib.sha256(abs_path.encode('utf-8')).hexdigest() + '.pkl')
+        
+        work_order = self._read_cached_work_order(cache_file, key)
+        if work_order is None:
+            work_order = self._parse_file(file_path)
+            self._write_cached_work_order(cache_file, key, work_order)
+        else:
+            work_order.file_path = file_path
+        
+        return work_order
+    
+    def _read_cached_work_order(self, cache_file: Path, key: tuple) -> Optional[WorkOrder]:
+        """Return the cached work order for key, or None on a miss."""
+        try:
+            with open(cache_file, 'rb') as f:
+                cached_key, work_order = pickle.load(f)
+        except Exception:
+            # Missing, unreadable or corrupt entries are just misses
+            return None
+        
+        if cached_key != key:
+            return None
+        try:
+            # Mark the entry as recently used for _prune_cache
+            os.utime(cache_file)
+        except OSError:
+            pass
+        return work_order
+    
+    def _write_cached_work_order(self, cache_file: Path, key: tuple, work_order: WorkOrder) -> None:
+        """Store a parsed work order in the cache (best effort)."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and rename it into place, so parallel
+            # workers never see a partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump((key, work_order), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, pickle.PicklingError):
+            return
+        
+        # Each process prunes a cache directory once, the first time it adds
+        # an entry there; runs that only hit the cache leave it alone
+        if self.cache_dir not in _pruned_cache_dirs:
+            _pruned_cache_dirs.add(self.cache_dir)
+            _prune_cache(self.cache_dir)
+    
+    def _parse_file(self, file_path: Path) -> WorkOrder:
+        """Parse a work order file with the parser for its file type."""
         # Determine file type and parse accordingly
         suffix = file_path.suffix.lower()
         
@@ -174,62 +675,56 @@ class WorkOrderChecker:
             # Default to text parsing
             work_order = self._parse_text_work_order(file_path)
         
+        return work_order
+    
+    def add_work_order(self, work_order: WorkOrder) -> None:
+        """Add a parsed work order and index its tasks for duplicate detection."""
         self.work_orders.append(work_order)
         
         # Index tasks for duplicate detection
+        name = work_order.name
+        all_tasks = self.all_tasks
         for task in work_order.tasks:
-            if task not in self.all_tasks:
-                self.all_tasks[task] = []
-            self.all_tasks[task].append(work_order.name)
-        
-        return work_order
+            entry = all_tasks.get(task._norm)
+            if entry is None:
+                all_tasks[task._norm] = (task, [name])
+            else:
+                names = entry[1]
+                names.append(name)
+                if len(names) == 2:
+                    self._duplicate_tasks += 1
+        self._total_tasks += len(work_order.tasks)
     
     def _parse_text_work_order(self, file_path: Path) -> WorkOrder:
         """Parse a text-based work order file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
         tasks = []
         
         # Look for patterns like "exit lights [212934] MOB B - ground floor - HRC back door"
-        # Focus on equipment with location information
-        lines = content.split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Look for equipment patterns with IDs and locations
-            equipment_pattern = r'(exit lights?|emergency lighting?|fire extinguisher)\s*\[([^\]]+)\]\s*(.+)'
-            
-            match = re.match(equipment_pattern, line, re.IGNORECASE)
-            if match:
-                equipment_type = match.group(1).strip()
-                equipment_id = match.group(2).strip()
-                location = match.group(3).strip()
+        # Focus on equipment with location information, falling back to general
+        # "description [ID] location" lines; one regex scan covers each block
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for content in _read_line_blocks(f, _TEXT_BLOCK_CHARS):
+                scanner = _TEXT_TASK_RE
+                if _TEXT_TASK_RE2 is not None and content.count('[') * _RE2_MIN_CHARS_PER_BRACKET < len(content):
+                    scanner = _TEXT_TASK_RE2
                 
-                task = Task(
-                    id=equipment_id,
-                    description=equipment_type,
-                    location=location,
-                    raw_text=line
-                )
-                tasks.append(task)
-            else:
-                # Fall back to general pattern matching
-                general_pattern = r'(.+?)\[([^\]]+)\](.+)'
-                match = re.match(general_pattern, line)
-                if match:
-                    description = match.group(1).strip()
-                    task_id = match.group(2).strip()
-                    location = match.group(3).strip()
+                for match in scanner.finditer(content):
+                    line = match.group(0).strip()
                     
-                    task = Task(
-                        id=task_id,
-                        description=description,
-                        location=location,
-                        raw_text=line
-                    )
+                    if match.group('etype'):
+                        task = Task(
+                            id=match.group('eid').strip(),
+                            description=match.group('etype').strip(),
+                            location=match.group('eloc').strip(),
+                            raw_text=line
+                        )
+                    else:
+                        task = Task(
+                            id=match.group('gid').strip(),
+                            description=match.group('gdesc').strip(),
+                            location=match.group('gloc').strip(),
+                            raw_text=line
+                        )
                     tasks.append(task)
         
         return WorkOrder(
@@ -243,33 +738,32 @@ class WorkOrderChecker:
         tasks = []
         
         with open(file_path, 'r', encoding='utf-8') as f:
-            # Try to detect if first row is header
-            sample = f.read(1024)
-            f.seek(0)
-            
+            # Rows are processed as they are read rather than loaded up front
             reader = csv.reader(f)
-            rows = list(reader)
+            first_row = next(reader, None)
             
-            if not rows:
+            if first_row is None:
                 return WorkOrder(file_path.stem, file_path, [])
             
             # Assume first row might be header if it contains common header words
             header_indicators = ['id', 'task', 'description', 'location', 'item']
-            first_row_lower = [cell.lower() for cell in rows[0]]
-            has_header = any(indicator in ' '.join(first_row_lower) for indicator in header_indicators)
+            first_row_lower = ' '.join(cell.lower() for cell in first_row)
+            has_header = any(indicator in first_row_lower for indicator in header_indicators)
             
-            start_row = 1 if has_header else 0
+            rows = enumerate(reader, 1)
+            if not has_header:
+                rows = itertools.chain([(0, first_row)], rows)
             
-            for i, row in enumerate(rows[start_row:], start_row):
-                if not row or not any(cell.strip() for cell in row):
-                    continue
-                
+            for i, row in rows:
                 # Join all non-empty cells to form the task description
-                task_text = ' '.join(cell.strip() for cell in row if cell.strip())
+                cells = [cell.strip() for cell in row]
+                task_text = ' '.join(cell for cell in cells if cell)
+                if not task_text:
+                    continue
                 
                 # Extract ID if possible
-                numbers = re.findall(r'\d+', task_text)
-                task_id = numbers[0] if numbers else f"row_{i}"
+                number = _DIGITS_RE.search(task_text)
+                task_id = number.group() if number else f"row_{i}"
                 
                 task = Task(
                     id=task_id,
@@ -287,8 +781,8 @@ class WorkOrderChecker:
     
     def _parse_json_work_order(self, file_path: Path) -> WorkOrder:
         """Parse a JSON work order file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = _load_json(f.read())
         
         tasks = []
         
@@ -322,7 +816,7 @@ class WorkOrderChecker:
         """Convert a JSON item to a Task object."""
         if isinstance(item, str):
             # Simple string task
-            numbers = re.findall(r'\d+', item)
+            numbers = _DIGITS_RE.findall(item)
             return Task(
                 id=numbers[0] if numbers else "unknown",
                 description=item,
@@ -350,28 +844,28 @@ class WorkOrderChecker:
     
     def find_duplicates(self) -> List[Dict[str, Any]]:
         """Find all duplicate tasks across work orders."""
-        duplicates = []
-        
-        for task, work_order_names in self.all_tasks.items():
-            if len(work_order_names) > 1:
-                duplicates.append({
-                    'task': task.raw_text,
-                    'task_id': task.id,
-                    'normalized': task.normalize(),
-                    'work_orders': work_order_names,
-                    'count': len(work_order_names)
-                })
+        duplicates = [
+            {
+                'task': task.raw_text,
+                'task_id': task.id,
+                'normalized': task._norm,
+                'work_orders': work_order_names,
+                'count': len(work_order_names)
+            }
+            for task, work_order_names in self.all_tasks.values()
+            if len(work_order_names) > 1
+        ]
         
         # Sort by number of duplicates (most duplicated first)
-        duplicates.sort(key=lambda x: x['count'], reverse=True)
+        duplicates.sort(key=itemgetter('count'), reverse=True)
         
         return duplicates
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics about the loaded work orders."""
-        total_tasks = sum(len(wo.tasks) for wo in self.work_orders)
+        total_tasks = self._total_tasks
         unique_tasks = len(self.all_tasks)
-        duplicate_tasks = sum(1 for tasks in self.all_tasks.values() if len(tasks) > 1)
+        duplicate_tasks = self._duplicate_tasks
         
         return {
             'work_orders_count': len(self.work_orders),
@@ -386,29 +880,35 @@ class WorkOrderChecker:
         duplicates = self.find_duplicates()
         stats = self.get_statistics()
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("Work Order Duplicate Analysis Report\n")
-            f.write("=" * 50 + "\n\n")
-            
-            f.write("Summary:\n")
-            f.write(f"- Total Work Orders: {stats['work_orders_count']}\n")
-            f.write(f"- Total Tasks: {stats['total_tasks']}\n")
-            f.write(f"- Unique Tasks: {stats['unique_tasks']}\n")
-            f.write(f"- Duplicate Tasks: {stats['duplicate_tasks']}\n")
-            f.write(f"- Duplication Rate: {stats['duplication_rate']:.1f}%\n\n")
+        # Build the report in memory and write it in one call
+        parts = [
+            "Work Order Duplicate Analysis Report\n",
+            "=" * 50 + "\n\n",
+            "Summary:\n",
+            f"- Total Work Orders: {stats['work_orders_count']}\n",
+            f"- Total Tasks: {stats['total_tasks']}\n",
+            f"- Unique Tasks: {stats['unique_tasks']}\n",
+            f"- Duplicate Tasks: {stats['duplicate_tasks']}\n",
+            f"- Duplication Rate: {stats['duplication_rate']:.1f}%\n\n",
+        ]
+        
+        if duplicates:
+            parts.append(f"Duplicate Tasks Found ({len(duplicates)}):\n")
+            parts.append("-" * 50 + "\n")
             
-            if duplicates:
-                f.write(f"Duplicate Tasks Found ({len(duplicates)}):\n")
-                f.write("-" * 50 + "\n")
-                
-                for i, duplicate in enumerate(duplicates, 1):
-                    f.write(f"\n{i}. Task ID: {duplicate['task_id']}\n")
-                    f.write(f"   Description: {duplicate['task']}\n")
-                    f.write(f"   Appears in {duplicate['count']} work orders:\n")
-                    for wo_name in duplicate['work_orders']:
-                        f.write(f"     - {wo_name}\n")
-            else:
-                f.write("No duplicate tasks found!\n")
+            for i, duplicate in enumerate(duplicates, 1):
+                parts.append(
+                    f"\n{i}. Task ID: {duplicate['task_id']}\n"
+                    f"   Description: {duplicate['task']}\n"
+                    f"   Appears in {duplicate['count']} work orders:\n"
+                )
+                for wo_name in duplicate['work_orders']:
+                    parts.append(f"     - {wo_name}\n")
+        else:
+            parts.append("No duplicate tasks found!\n")
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(''.join(parts))
     
     def _parse_excel_work_order(self, file_path: Path) -> WorkOrder:
         """Parse an Excel work order file (.xls or .xlsx)."""
@@ -417,20 +917,24 @@ class WorkOrderChecker:
         
         try:
             # Try to read Excel file
-            df = pd.read_excel(file_path, engine='openpyxl' if file_path.suffix == '.xlsx' else 'xlrd')
+            # Read every cell as text so pandas skips type inference and
+            # whole-number IDs aren't turned into floats by blank cells
+            df = pd.read_excel(file_path, engine='openpyxl' if file_path.suffix == '.xlsx' else 'xlrd',
+                               dtype=str)
             tasks = []
             
-            for index, row in df.iterrows():
-                # Convert row to string, joining non-null values
-                row_values = [str(val) for val in row.values if pd.notna(val)]
+            # itertuples yields plain tuples, avoiding a Series per row;
+            # empty cells come through as NaN (a float), so keep only strings
+            for index, *values in df.itertuples(name=None):
+                row_values = [val for val in values if isinstance(val, str)]
                 if not row_values:
                     continue
                 
                 task_text = ' '.join(row_values)
                 
                 # Extract ID if possible
-                numbers = re.findall(r'\d+', task_text)
-                task_id = numbers[0] if numbers else f"row_{index}"
+                number = _DIGITS_RE.search(task_text)
+                task_id = number.group() if number else f"row_{index}"
                 
                 task = Task(
                     id=task_id,
@@ -450,54 +954,50 @@ class WorkOrderChecker:
     
     def _parse_pdf_work_order(self, file_path: Path) -> WorkOrder:
         """Parse a PDF work order file."""
-        if not HAS_PDF:
+        if not (HAS_PDFIUM or HAS_PDF):
             raise ImportError("PyPDF2 is required for PDF file support. Install with: pip install PyPDF2")
         
         try:
             tasks = []
-            with open(file_path, 'rb') as file:
-                pdf_reader = PdfReader(file)
-                
-                # Extract text from all pages
-                text_content = ""
-                for page in pdf_reader.pages:
-                    text_content += page.extract_text() + "\n"
-                
-                # Parse the extracted text using the same logic as text files
-                lines = text_content.split('\n')
-                task_pattern = r'(.+?)\[(\d+)\](.+)'
+            
+            # Extract text from all pages (each page starts on a new line)
+            text_content = "\n".join(_pdf_page_texts(file_path))
+            
+            # Parse the extracted text using the same logic as text files
+            lines = text_content.split('\n')
+            
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
                 
-                for line in lines:
-                    line = line.strip()
-                    if not line:
-                        continue
+                # Try to match the pattern with ID in brackets (the cheap "["
+                # check skips the regex for the many lines that can't match)
+                match = _NUMERIC_TASK_RE.match(line) if '[' in line else None
+                if match:
+                    description = match.group(1).strip()
+                    task_id = match.group(2)
+                    location = match.group(3).strip()
                     
-                    # Try to match the pattern with ID in brackets
-                    match = re.match(task_pattern, line)
-                    if match:
-                        description = match.group(1).strip()
-                        task_id = match.group(2)
-                        location = match.group(3).strip()
-                        
+                    task = Task(
+                        id=task_id,
+                        description=description,
+                        location=location,
+                        raw_text=line
+                    )
+                    tasks.append(task)
+                else:
+                    # If no pattern match, check if line looks like a task
+                    numbers = _DIGITS_RE.findall(line)
+                    if numbers and len(line) > 10:  # Reasonable task length
+                        task_id = numbers[0]
                         task = Task(
                             id=task_id,
-                            description=description,
-                            location=location,
+                            description=line,
+                            location="",
                             raw_text=line
                         )
                         tasks.append(task)
-                    else:
-                        # If no pattern match, check if line looks like a task
-                        numbers = re.findall(r'\d+', line)
-                        if numbers and len(line) > 10:  # Reasonable task length
-                            task_id = numbers[0]
-                            task = Task(
-                                id=task_id,
-                                description=line,
-                                location="",
-                                raw_text=line
-                            )
-                            tasks.append(task)
             
             return WorkOrder(
                 name=file_path.stem,
@@ -509,35 +1009,34 @@ class WorkOrderChecker:
     
     def _parse_html_work_order(self, file_path: Path) -> WorkOrder:
         """Parse an HTML work order file."""
-        if not HAS_BS4:
+        if not (HAS_SELECTOLAX or HAS_BS4):
             raise ImportError("beautifulsoup4 is required for HTML file support. Install with: pip install beautifulsoup4")
         
         try:
             with open(file_path, 'r', encoding='utf-8') as file:
-                soup = BeautifulSoup(file.read(), 'html.parser')
+                html = file.read()
                 
                 tasks = []
                 
                 # Look specifically for equipment entries in table cells
                 # Pattern: <b>Exit Light [ID]</b> Location description
-                table_cells = soup.find_all('td', class_='data_underline')
-                
-                for cell in table_cells:
-                    cell_text = cell.get_text(separator=' ', strip=True)
+                for cell_text in _html_cell_texts(html, fast=self.fast_html):
+                    # Every equipment entry has a bracketed ID; skip other cells
+                    # without running the regex
+                    if '[' not in cell_text:
+                        continue
                     
                     # Look for equipment with bold formatting and IDs
                     # Pattern: Exit Light(s) [ID] Location: Building details
-                    equipment_pattern = r'(Exit Lights?|Fire Extinguishers?|Emergency Lights?)(?:\s+[\w-]+)?\s*\[([^\]]+)\]\s*(.+?)(?:\s*MAIN HOSPITAL|\s*Equipment Lists|\s*Exit Lights?|$)'
-                    
-                    match = re.search(equipment_pattern, cell_text, re.IGNORECASE)
+                    match = _HTML_EQUIP_RE.search(cell_text)
                     if match:
                         equipment_type = match.group(1).strip()
                         equipment_id = match.group(2).strip()
                         location = match.group(3).strip()
                         
                         # Clean up location - remove trailing colons and extra building info
-                        location = re.sub(r':\s*$', '', location)
-                        location = re.sub(r'\s+', ' ', location).strip()
+                        location = _TRAILING_COLON_RE.sub('', location)
+                        location = _WS_RE.sub(' ', location).strip()
                         
                         if location:  # Only add if we have a meaningful location
                             task_text = f"{equipment_type} [{equipment_id}] {location}"
@@ -564,49 +1063,42 @@ class WorkOrderChecker:
             raise ImportError("xml.etree.ElementTree is required for XML file support (usually included with Python)")
         
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
             tasks = []
             
             # Look for common XML structures
             # Try to find elements that might contain task information
-            for element in root.iter():
-                if element.text and element.text.strip():
-                    text = element.text.strip()
-                    
-                    # Skip very short text or common XML tags
-                    if len(text) < 5 or text.lower() in ['true', 'false', 'yes', 'no']:
-                        continue
-                    
-                    # Look for task patterns
-                    task_pattern = r'(.+?)\[(\d+)\](.+)'
-                    match = re.match(task_pattern, text)
+            for text in _iter_xml_texts(file_path):
+                # Skip very short text or common XML tags
+                if len(text) < 5 or text.lower() in ['true', 'false', 'yes', 'no']:
+                    continue
+                
+                # Look for task patterns
+                match = _NUMERIC_TASK_RE.match(text) if '[' in text else None
+                
+                if match:
+                    description = match.group(1).strip()
+                    task_id = match.group(2)
+                    location = match.group(3).strip()
                     
-                    if match:
-                        description = match.group(1).strip()
-                        task_id = match.group(2)
-                        location = match.group(3).strip()
-                        
+                    task = Task(
+                        id=task_id,
+                        description=description,
+                        location=location,
+                        raw_text=text
+                    )
+                    tasks.append(task)
+                else:
+                    # Check for potential task IDs
+                    numbers = _DIGITS_RE.findall(text)
+                    if numbers and len(text) > 10:
+                        task_id = numbers[0]
                         task = Task(
                             id=task_id,
-                            description=description,
-                            location=location,
+                            description=text,
+                            location="",
                             raw_text=text
                         )
                         tasks.append(task)
-                    else:
-                        # Check for potential task IDs
-                        numbers = re.findall(r'\d+', text)
-                        if numbers and len(text) > 10:
-                            task_id = numbers[0]
-                            task = Task(
-                                id=task_id,
-                                description=text,
-                                location="",
-                                raw_text=text
-                            )
-                            tasks.append(task)
             
             return WorkOrder(
                 name=file_path.stem,
@@ -635,8 +1127,7 @@ class WorkOrderChecker:
                     continue
                 
                 # Look for task patterns
-                task_pattern = r'(.+?)\[(\d+)\](.+)'
-                match = re.match(task_pattern, text)
+                match = _NUMERIC_TASK_RE.match(text) if '[' in text else None
                 
                 if match:
                     description = match.group(1).strip()
@@ -652,7 +1143,7 @@ class WorkOrderChecker:
                     tasks.append(task)
                 else:
                     # Check for potential tasks with numbers
-                    numbers = re.findall(r'\d+', text)
+                    numbers = _DIGITS_RE.findall(text)
                     if numbers and len(text) > 10:
                         task_id = numbers[0]
                         task = Task(
@@ -668,7 +1159,7 @@ class WorkOrderChecker:
                 for row in table.rows:
                     row_text = ' '.join(cell.text.strip() for cell in row.cells if cell.text.strip())
                     if len(row_text) > 10:
-                        numbers = re.findall(r'\d+', row_text)
+                        numbers = _DIGITS_RE.findall(row_text)
                         if numbers:
                             task_id = numbers[0]
                             task = Task(
@@ -685,4 +1176,10 @@ class WorkOrderChecker:
                 tasks=tasks
             )
         except Exception as e:
-            raise Exception(f"Error parsing Word document {file_path}: {e}")
\ No newline at end of file
+            raise Exception(f"Error parsing Word document {file_path}: {e}")
+
+
+def _parse_dispatch(file_path: Path, cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+                    fast_html: bool = True) -> WorkOrder:
+    """Parse a single work order file; top-level so worker processes can run it."""
+    return WorkOrderChecker(cache_dir=cache_dir, fast_html=fast_html).parse_work_order(Path(file_path))
@@ -0,0 +1,69 @@
+# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller spec for Work Order Duplicate Checker
+#
+# A single Analysis covers both entry points so module discovery and bytecode
+# compilation run once. The GUI and console executables share the resulting
+# PYZ archive.
+#
+# Build with: pyinstaller --noconfirm work_order_checker.spec
+
+import os
+import sys
+
+icon = 'icon.ico' if os.path.exists('icon.ico') else None
+
+# Stripping symbols is only supported for non-Windows binaries
+strip = sys.platform != 'win32'
+
+a = Analysis(
+    ['gui.py', 'main.py'],
+    datas=[('sample_data', 'sample_data')],
+    # Development/test-only packages that would otherwise be picked up from the
+    # build environment and inflate the onefile archive
+    excludes=['matplotlib', 'pytest', 'IPython', 'tkinter.test', 'PIL'],
+)
+
+pyz = PYZ(a.pure)
+
+# a.scripts holds the bootstrap/runtime hooks followed by both entry points;
+# each executable keeps the hooks and drops the other entry point.
+gui_scripts = [script for script in a.scripts if script[0] != 'main']
+console_scripts = [script for script in a.scripts if script[0] != 'gui']
+
+# The GUI is built as a onedir bundle: a onefile exe would unpack the whole
+# archive to a temp folder on every launch before the window could appear.
+gui_exe = EXE(
+    pyz,
+    gui_scripts,
+    [],
+    exclude_binaries=True,
+    name='WorkOrderChecker',
+    icon=icon,
+    console=False,
+    strip=strip,
+    upx=True,
+    contents_directory='_internal',
+)
+
+gui_dir = COLLECT(
+    gui_exe,
+    a.binaries,
+    a.datas,
+    name='WorkOrderChecker',
+    strip=strip,
+    upx=True,
+)
+
+# The console version stays a single file for easy one-off use
+
+console_exe = EXE(
+    pyz,
+    console_scripts,
+    a.binaries,
+    a.datas,
+    [],
+    name='WorkOrderChecker-Console',
+    console=True,
+    strip=strip,
+    upx=True,
+)